@@ -8,6 +8,9 @@ Design Philosophy:
 - Definitions included: User knows how each metric is calculated
 - "No data available" shown clearly when data doesn't exist
 """
+from bisect import bisect_right
+from functools import partial
+from types import MappingProxyType
 import streamlit as st
 import plotly.graph_objects as go
 
@@ -21,10 +24,7 @@ st.set_page_config(
 
 # === IMPORTS ===
 from data.common_metrics import (
-    get_observation_metrics,
-    get_lp_engagement_metrics,
-    get_training_metrics,
-    get_fico_metrics,
+    get_all_dashboard_metrics,
     get_student_learning_metrics,
     METRIC_DEFINITIONS,
     REGION_PARAMETERS,
@@ -32,21 +32,18 @@ from data.common_metrics import (
     REGION_COLORS,
 )
 from data.cache_layer import data_freshness_banner, clear_all_caches
-from data import balochistan_queries, moawin_queries
+from data import balochistan_queries
 from styles.design_system import (
     inject_css,
     section_title,
     insight_card,
     metric_card,
-    grade_row,
-    divider,
+    grade_rows,
+    NO_DATA_HTML,
     COLORS,
-    plotly_layout_defaults,
+    register_plotly_template,
 )
 
-# === INJECT DESIGN SYSTEM ===
-inject_css()
-
 # Consistent region order and labels
 REGION_ORDER = ["ICT", "Balochistan", "RWP", "Moawin", "Rumi"]
 REGION_LABELS = {
@@ -64,18 +61,42 @@ REGION_SHORT = {
     "Rumi": "Rumi",
 }
 
+_HEADER_HTML = (
+    '<div style="padding: 0.5rem 0 0.25rem 0;">'
+    '<div style="font-size: 0.625rem; font-weight: 600; color: #9CA3AF; '
+    'text-transform: uppercase; letter-spacing: 0.15em;">TALEEMABAD</div>'
+    '<div style="font-size: 1.5rem; font-weight: 600; color: #1A1A1A;">'
+    'Observability Dashboard</div>'
+    '</div>'
+)
+
+# (region, short label, color) per region, in display order
+_REGION_META = tuple((r, REGION_SHORT[r], REGION_COLORS[r]) for r in REGION_ORDER)
+
+# Top-level sections, one rendered per rerun
+SECTION_VIEWS = ("Program Details", "Implementation Fidelity", "Student Learning")
 
-def _no_data_html(region_label: str, reason: str = "No data available") -> str:
-    """Return styled HTML for a region with no data."""
-    return (
-        f'<div style="background: #F9FAFB; border-radius: 8px; padding: 1rem; '
-        f'text-align: center; border: 1px dashed #E5E7EB;">'
-        f'<div style="font-size: 0.8125rem; font-weight: 600; color: #9CA3AF;">'
-        f'{region_label}</div>'
-        f'<div style="font-size: 0.75rem; color: #D1D5DB; margin-top: 0.25rem;">'
-        f'{reason}</div>'
-        f'</div>'
+# Section 2 subsections, in render order (keys into get_all_dashboard_metrics)
+FIDELITY_SUBSECTIONS = ("observations", "lp", "training", "fico")
+_FIDELITY_TITLES = {
+    "observations": "2a. Observations (vs Benchmark)",
+    "lp": "2b. Lesson Plan Engagement",
+    "training": "2c. Teacher Training Engagement",
+    "fico": "2d. FICO Scores by Section (B, C, D)",
+}
+_FIDELITY_HEADING_HTML = {
+    key: (
+        '<div style="font-size: 0.875rem; font-weight: 600; color: #374151; '
+        f'{"margin-top: 1.5rem; " if i else ""}margin-bottom: 0.5rem;">{_FIDELITY_TITLES[key]}</div>'
     )
+    for i, key in enumerate(FIDELITY_SUBSECTIONS)
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _section_title_html() -> dict:
+    """Precompute the numbered section title HTML for every section view."""
+    return {view: section_title(f"{i}. {view}") for i, view in enumerate(SECTION_VIEWS, 1)}
 
 
 def _metric_definition_expander(key: str):
@@ -86,19 +107,175 @@ def _metric_definition_expander(key: str):
             st.caption(defn.get("definition", ""))
 
 
+# =============================================================================
+# FIGURE BUILDERS (cached on the plotted values, so widget reruns skip Plotly)
+# =============================================================================
+
+_PLOT_CONFIG = MappingProxyType({"displayModeBar": False})
+
+
+def _render_figure(fig: go.Figure):
+    """
+    Emit a cached figure at full container width with the mode bar hidden.
+
+    theme=None skips Streamlit's theme merge; colors come from the registered
+    template and REGION_COLORS baked into each figure.
+    """
+    st.plotly_chart(fig, use_container_width=True, theme=None, config=dict(_PLOT_CONFIG))
+
+
+# Static per-chart layout overrides on top of the registered template
+_HLEGEND = dict(
+    orientation="h", yanchor="bottom", y=1.02,
+    xanchor="right", x=1, font=dict(size=11),
+)
+_OBSERVATIONS_LAYOUT = MappingProxyType(dict(
+    height=280,
+    legend=_HLEGEND,
+))
+_HBAR_LAYOUT = MappingProxyType(dict(
+    height=220,
+    margin=dict(t=10, b=40, l=100, r=80),
+    yaxis=dict(autorange="reversed", showgrid=False),
+    showlegend=False,
+))
+_FICO_LAYOUT = MappingProxyType(dict(
+    height=300,
+    barmode="group",
+    yaxis=dict(range=[0, 100], ticksuffix="%"),
+    legend=_HLEGEND,
+))
+_MOAWIN_BAR_LAYOUT = MappingProxyType(dict(
+    height=250,
+    yaxis=dict(range=[0, 100], ticksuffix="%"),
+    showlegend=False,
+))
+
+
+@st.cache_resource(ttl=300, show_spinner=False)
+def _build_observations_fig(regions: tuple, actuals: tuple, benchmarks: tuple, colors: tuple) -> go.Figure:
+    """Build the observations-vs-benchmark bar chart."""
+    traces = [go.Bar(
+        x=list(regions),
+        y=list(actuals),
+        name="Actual",
+        marker_color=list(colors),
+        texttemplate="%{y:,}",
+        textposition="outside",
+    )]
+
+    bm_pairs = [(r, b) for r, b in zip(regions, benchmarks) if b is not None]
+    if bm_pairs:
+        bm_x, bm_y = zip(*bm_pairs)
+        traces.append(go.Scatter(
+            x=bm_x, y=bm_y,
+            mode="markers",
+            marker=dict(symbol="line-ew-open", size=16, color="#9CA3AF", line_width=3),
+            name="Monthly Benchmark",
+        ))
+
+    fig = go.Figure(data=traces, layout={**_OBSERVATIONS_LAYOUT, "showlegend": bool(bm_pairs)})
+    return fig
+
+
+@st.cache_resource(ttl=300, show_spinner=False)
+def _build_hbar_fig(
+    value_label: str, regions: tuple, values: tuple, colors: tuple, details: tuple
+) -> go.Figure:
+    """
+    Build a horizontal per-region bar chart (LP and training engagement).
+
+    Args:
+        value_label: Hover label for the bar value (e.g. "Total")
+        regions, values, colors: Per-bar region label, value and color
+        details: Per-bar (unique_teachers, per_teacher, type) for the hover text
+    """
+    # Numbers are formatted client-side; only the optional type line is prebuilt
+    customdata = [
+        (teachers, per_t, f"<br>Type: {extra}" if extra else "")
+        for teachers, per_t, extra in details
+    ]
+
+    fig = go.Figure(
+        data=[go.Bar(
+            y=list(regions), x=list(values),
+            orientation="h",
+            marker_color=list(colors),
+            texttemplate="%{x:,}",
+            textposition="outside",
+            customdata=customdata,
+            hovertemplate=(
+                f"{value_label}: %{{x:,}}<br>Teachers: %{{customdata[0]:,}}"
+                "<br>Per teacher: %{customdata[1]}%{customdata[2]}<extra></extra>"
+            ),
+        )],
+        layout=dict(_HBAR_LAYOUT),
+    )
+    return fig
+
+
+_FICO_SECTIONS = ("Section B", "Section C", "Section D")
+
+
+@st.cache_resource(ttl=300, show_spinner=False)
+def _build_fico_fig(series: tuple) -> go.Figure:
+    """
+    Build the grouped FICO section chart.
+
+    Args:
+        series: Tuple of (name, color, b_avg, c_avg, d_avg) per region
+    """
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=_FICO_SECTIONS,
+                y=[b_avg, c_avg, d_avg],
+                name=name,
+                marker_color=color,
+                texttemplate="%{y:.0f}%",
+                textposition="outside",
+            )
+            for name, color, b_avg, c_avg, d_avg in series
+        ],
+        layout=dict(_FICO_LAYOUT),
+    )
+    return fig
+
+
+@st.cache_resource(ttl=300, show_spinner=False)
+def _build_moawin_scores_fig(subject_scores: tuple) -> go.Figure:
+    """
+    Build the Moawin average-score-by-subject bar chart.
+
+    Args:
+        subject_scores: Tuple of (subject, avg_score) pairs
+    """
+    subjects = [subject for subject, _ in subject_scores]
+    avg_scores = [score for _, score in subject_scores]
+    fig = go.Figure(
+        data=[go.Bar(
+            x=subjects,
+            y=avg_scores,
+            marker_color=REGION_COLORS["Moawin"],
+            texttemplate="%{y:.0f}%",
+            textposition="outside",
+        )],
+        layout=dict(_MOAWIN_BAR_LAYOUT),
+    )
+    return fig
+
+
 def main():
     """Main dashboard entry point."""
 
+    # === DESIGN SYSTEM ===
+    # Re-emitted every rerun (Streamlit drops elements a rerun skips); the
+    # <style> tag itself is prebuilt once at design_system import.
+    inject_css()
+    register_plotly_template()
+
     # === HEADER ===
-    st.markdown(
-        '<div style="padding: 0.5rem 0 0.25rem 0;">'
-        '<div style="font-size: 0.625rem; font-weight: 600; color: #9CA3AF; '
-        'text-transform: uppercase; letter-spacing: 0.15em;">TALEEMABAD</div>'
-        '<div style="font-size: 1.5rem; font-weight: 600; color: #1A1A1A;">'
-        'Observability Dashboard</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
     # === DATA FRESHNESS BANNER ===
     st.markdown(data_freshness_banner(), unsafe_allow_html=True)
@@ -109,398 +286,345 @@ def main():
             clear_all_caches()
             st.rerun()
 
-    # =====================================================================
-    # SECTION 1: PROGRAM DETAILS
-    # =====================================================================
-    _render_program_details()
-
-    st.markdown(divider(), unsafe_allow_html=True)
-
-    # =====================================================================
-    # SECTION 2: IMPLEMENTATION FIDELITY
-    # =====================================================================
-    _render_implementation_fidelity()
+    # === VIEW SELECTOR ===
+    # Only the selected section executes. st.tabs would run every tab body
+    # (and the metric fetch) on each rerun, so a pill radio is used instead.
+    view = st.radio(
+        "Section", SECTION_VIEWS, horizontal=True,
+        label_visibility="collapsed", key="section_view",
+    )
 
-    st.markdown(divider(), unsafe_allow_html=True)
+    st.markdown(_section_title_html()[view], unsafe_allow_html=True)
+
+    if view == "Program Details":
+        # =================================================================
+        # SECTION 1: PROGRAM DETAILS
+        # =================================================================
+        _render_program_details()
+
+    elif view == "Implementation Fidelity":
+        # =================================================================
+        # SECTION 2: IMPLEMENTATION FIDELITY
+        # =================================================================
+        # Paint each subsection heading with a loading placeholder before the
+        # metric queries run; the placeholders are replaced once data arrives.
+        fidelity_slots = {}
+        for key in FIDELITY_SUBSECTIONS:
+            st.markdown(_FIDELITY_HEADING_HTML[key], unsafe_allow_html=True)
+            fidelity_slots[key] = st.empty()
+            fidelity_slots[key].caption("Loading…")
+
+        metrics = get_all_dashboard_metrics()
+        _render_implementation_fidelity(fidelity_slots, metrics)
 
-    # =====================================================================
-    # SECTION 3: STUDENT LEARNING
-    # =====================================================================
-    _render_student_learning()
+    else:
+        # =================================================================
+        # SECTION 3: STUDENT LEARNING
+        # =================================================================
+        _render_student_learning()
 
 
 # =============================================================================
 # SECTION 1: PROGRAM DETAILS
 # =============================================================================
 
-def _render_program_details():
-    st.markdown(section_title("1. Program Details"), unsafe_allow_html=True)
-
-    # 5 region cards in a row
-    cols = st.columns(5)
-    for i, region in enumerate(REGION_ORDER):
-        params = REGION_PARAMETERS.get(region, {})
-        color = REGION_COLORS[region]
-        with cols[i]:
-            schools = params.get("schools", "—")
-            teachers = params.get("teachers", "—")
-            students = params.get("students", "—")
-            coaches = params.get("coaches", "—")
-            coaches_detail = params.get("coaches_detail", "")
-
-            schools_str = f"{schools:,}" if isinstance(schools, int) else str(schools)
-            teachers_str = f"{teachers:,}" if isinstance(teachers, int) else str(teachers)
-            students_str = f"{students:,}" if isinstance(students, int) else str(students)
-
-            # Calculate teacher:student ratio
-            if isinstance(teachers, int) and isinstance(students, int) and teachers > 0:
-                ratio = round(students / teachers)
-                ratio_str = f"1:{ratio}"
-            else:
-                ratio_str = "—"
-
-            # Coaches display
-            if coaches == "AI-only":
-                coaches_str = "AI-only"
-            elif isinstance(coaches, int):
-                coaches_str = str(coaches)
-                if coaches_detail:
-                    coaches_str += f" ({coaches_detail})"
-            else:
-                coaches_str = "—"
-
-            st.markdown(
-                f'<div style="border-left: 3px solid {color}; padding: 0.75rem; '
-                f'background: white; border-radius: 6px; '
-                f'box-shadow: 0 1px 3px rgba(0,0,0,0.04);">'
-                f'<div style="font-size: 0.8125rem; font-weight: 600; color: {color}; '
-                f'margin-bottom: 0.5rem;">{REGION_LABELS[region]}</div>'
-                f'<div style="font-size: 0.6875rem; color: #374151; line-height: 1.8;">'
-                f'<div><span style="color: #9CA3AF;">Schools</span> <strong>{schools_str}</strong></div>'
-                f'<div><span style="color: #9CA3AF;">Teachers</span> <strong>{teachers_str}</strong></div>'
-                f'<div><span style="color: #9CA3AF;">Students</span> <strong>{students_str}</strong></div>'
-                f'<div><span style="color: #9CA3AF;">Ratio</span> <strong>{ratio_str}</strong></div>'
-                f'<div><span style="color: #9CA3AF;">Coaches</span> <strong>{coaches_str}</strong></div>'
-                f'</div></div>',
-                unsafe_allow_html=True
-            )
-
-    # Cross-region comparison table
-    st.markdown("")
-    st.markdown(
-        '<div style="font-size: 0.6875rem; font-weight: 600; color: #9CA3AF; '
-        'text-transform: uppercase; letter-spacing: 0.05em; margin-top: 1rem;">'
-        'Cross-Region Comparison</div>',
-        unsafe_allow_html=True
-    )
-
-    # Build comparison table
-    rows = []
+@st.cache_resource(show_spinner=False)
+def _region_display() -> dict:
+    """
+    Pre-format the static REGION_PARAMETERS for Section 1, once per process.
+
+    A single pass over the regions builds both the card row and the
+    comparison table. app.py re-executes on every rerun, so module-level
+    work here would be repeated; st.cache_resource keeps the result instead.
+
+    Returns:
+        Dict with cards_html (the flex row of region cards) and table_html
+        (the cross-region comparison table)
+    """
+    card_parts = []
+    table_rows = []
     for region in REGION_ORDER:
         params = REGION_PARAMETERS.get(region, {})
+        color = REGION_COLORS[region]
         schools = params.get("schools", "—")
         teachers = params.get("teachers", "—")
         students = params.get("students", "—")
         coaches = params.get("coaches", "—")
+        coaches_detail = params.get("coaches_detail", "")
+
+        schools_str = f"{schools:,}" if isinstance(schools, int) else str(schools)
+        teachers_str = f"{teachers:,}" if isinstance(teachers, int) else str(teachers)
+        students_str = f"{students:,}" if isinstance(students, int) else str(students)
 
+        # Calculate teacher:student ratio
         if isinstance(teachers, int) and isinstance(students, int) and teachers > 0:
-            ratio = f"1:{round(students / teachers)}"
+            ratio_str = f"1:{round(students / teachers)}"
         else:
-            ratio = "—"
-
-        rows.append({
-            "Region": REGION_SHORT[region],
-            "Schools": f"{schools:,}" if isinstance(schools, int) else str(schools),
-            "Teachers": f"{teachers:,}" if isinstance(teachers, int) else str(teachers),
-            "Students": f"{students:,}" if isinstance(students, int) else str(students),
-            "Ratio": ratio,
-            "Coaches": str(coaches),
-        })
+            ratio_str = "—"
+
+        # Coaches display
+        if coaches == "AI-only":
+            coaches_str = "AI-only"
+        elif isinstance(coaches, int):
+            coaches_str = str(coaches)
+            if coaches_detail:
+                coaches_str += f" ({coaches_detail})"
+        else:
+            coaches_str = "—"
+
+        card_parts.append(
+            f'<div style="flex: 1; min-width: 0; border-left: 3px solid {color}; padding: 0.75rem; '
+            f'background: white; border-radius: 6px; '
+            f'box-shadow: 0 1px 3px rgba(0,0,0,0.04);">'
+            f'<div style="font-size: 0.8125rem; font-weight: 600; color: {color}; '
+            f'margin-bottom: 0.5rem;">{REGION_LABELS[region]}</div>'
+            f'<div style="font-size: 0.6875rem; color: #374151; line-height: 1.8;">'
+            f'<div><span style="color: #9CA3AF;">Schools</span> <strong>{schools_str}</strong></div>'
+            f'<div><span style="color: #9CA3AF;">Teachers</span> <strong>{teachers_str}</strong></div>'
+            f'<div><span style="color: #9CA3AF;">Students</span> <strong>{students_str}</strong></div>'
+            f'<div><span style="color: #9CA3AF;">Ratio</span> <strong>{ratio_str}</strong></div>'
+            f'<div><span style="color: #9CA3AF;">Coaches</span> <strong>{coaches_str}</strong></div>'
+            f'</div></div>'
+        )
+        table_rows.append(
+            f'<tr><td><strong>{REGION_SHORT[region]}</strong></td>'
+            f'<td>{schools_str}</td><td>{teachers_str}</td><td>{students_str}</td>'
+            f'<td>{ratio_str}</td><td>{coaches}</td></tr>'
+        )
 
-    import pandas as pd
-    df = pd.DataFrame(rows)
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    return {
+        "cards_html": f'<div style="display: flex; gap: 1rem;">{"".join(card_parts)}</div>',
+        "table_html": (
+            '<table class="compare-table"><thead><tr>'
+            '<th>Region</th><th>Schools</th><th>Teachers</th><th>Students</th>'
+            '<th>Ratio</th><th>Coaches</th>'
+            f'</tr></thead><tbody>{"".join(table_rows)}</tbody></table>'
+        ),
+    }
 
 
-# =============================================================================
-# SECTION 2: IMPLEMENTATION FIDELITY
-# =============================================================================
+def _render_program_details():
+    # 5 region cards in a row, emitted as a single flex row
+    st.markdown(_region_display()["cards_html"], unsafe_allow_html=True)
 
-def _render_implementation_fidelity():
-    st.markdown(section_title("2. Implementation Fidelity"), unsafe_allow_html=True)
+    # Cross-region comparison table
+    st.markdown(
+        '<div style="font-size: 0.6875rem; font-weight: 600; color: #9CA3AF; '
+        'text-transform: uppercase; letter-spacing: 0.05em; margin-top: 1.5rem;">'
+        'Cross-Region Comparison</div>',
+        unsafe_allow_html=True
+    )
 
-    # --- 2a. Observations ---
-    _render_observations_subsection()
-    st.markdown("")
+    st.markdown(_region_display()["table_html"], unsafe_allow_html=True)
 
-    # --- 2b. Lesson Plan Engagement ---
-    _render_lp_subsection()
-    st.markdown("")
 
-    # --- 2c. Teacher Training ---
-    _render_training_subsection()
-    st.markdown("")
+# =============================================================================
+# SECTION 2: IMPLEMENTATION FIDELITY
+# =============================================================================
 
-    # --- 2d. FICO Scores ---
-    _render_fico_subsection()
+def _render_implementation_fidelity(slots: dict, metrics: dict):
+    """Replace the fidelity loading placeholders (2a-2d) with the batched metrics."""
+    renderers = {
+        "observations": _render_observations_subsection,
+        "lp": partial(_render_hbar_subsection, "lp"),
+        "training": partial(_render_hbar_subsection, "training"),
+        "fico": _render_fico_subsection,
+    }
+    for key in FIDELITY_SUBSECTIONS:
+        with slots[key].container():
+            renderers[key](metrics[key])
+
+
+# Caption text per region status; "active" regions only get a caption when
+# they have nothing to plot.
+_STATUS_TEXT = {
+    "no_data": "No data",
+    "active": "No data",
+    "launching_q2_2026": "Launching Q2 2026",
+    "not_applicable": "N/A",
+    "coaching_only": "N/A (coaching only)",
+}
 
 
-def _render_observations_subsection():
-    st.markdown(
-        '<div style="font-size: 0.875rem; font-weight: 600; color: #374151; '
-        'margin-bottom: 0.5rem;">2a. Observations (vs Benchmark)</div>',
-        unsafe_allow_html=True
-    )
-    _metric_definition_expander("observations")
+@st.cache_resource(show_spinner=False)
+def _status_labels() -> dict:
+    """Precompute the '**Region**: status' caption fragments for every region/status pair."""
+    return {
+        (region, status): f"**{REGION_SHORT[region]}**: {text}"
+        for region in REGION_ORDER
+        for status, text in _STATUS_TEXT.items()
+    }
 
-    data = get_observation_metrics()
 
+def _prepare_observations(data: dict) -> dict:
     regions_active = []
     actuals = []
     benchmarks = []
     bar_colors = []
     annotations = []
+    labels = _status_labels()
 
-    for region in REGION_ORDER:
+    for region, short_name, color in _REGION_META:
         d = data.get(region, {})
         status = d.get("status", "no_data")
 
         if status == "active" and d.get("actual") is not None and d["actual"] > 0:
-            regions_active.append(REGION_SHORT[region])
+            regions_active.append(short_name)
             actuals.append(d["actual"])
             benchmarks.append(d.get("benchmark_monthly"))
-            bar_colors.append(REGION_COLORS[region])
-        elif status == "launching_q2_2026":
-            annotations.append(f"**{REGION_SHORT[region]}**: Launching Q2 2026")
-        elif status == "not_applicable":
-            annotations.append(f"**{REGION_SHORT[region]}**: N/A")
+            bar_colors.append(color)
         else:
-            annotations.append(f"**{REGION_SHORT[region]}**: No data")
+            annotations.append(labels.get((region, status), labels[(region, "no_data")]))
 
+    chart = None
     if actuals:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=regions_active,
-            y=actuals,
-            name="Actual",
-            marker_color=bar_colors,
-            text=[f"{v:,}" for v in actuals],
-            textposition="outside",
-        ))
-
-        bm_x = [r for r, b in zip(regions_active, benchmarks) if b is not None]
-        bm_y = [b for b in benchmarks if b is not None]
-        if bm_x:
-            fig.add_trace(go.Scatter(
-                x=bm_x, y=bm_y,
-                mode="markers",
-                marker=dict(symbol="line-ew-open", size=16, color="#9CA3AF", line_width=3),
-                name="Monthly Benchmark",
-            ))
-
-        base_layout = plotly_layout_defaults(height=280)
-        base_layout["showlegend"] = bool(bm_x)
-        base_layout["legend"] = dict(
-            orientation="h", yanchor="bottom", y=1.02,
-            xanchor="right", x=1, font=dict(size=11)
+        chart = _build_observations_fig(
+            tuple(regions_active), tuple(actuals), tuple(benchmarks), tuple(bar_colors)
         )
-        fig.update_layout(**base_layout)
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
-
-    if annotations:
-        st.caption(" · ".join(annotations))
-
-
-def _render_lp_subsection():
-    st.markdown(
-        '<div style="font-size: 0.875rem; font-weight: 600; color: #374151; '
-        'margin-bottom: 0.5rem;">2b. Lesson Plan Engagement</div>',
-        unsafe_allow_html=True
-    )
-    _metric_definition_expander("lp_engagement")
-
-    data = get_lp_engagement_metrics()
-
-    regions_show = []
-    values = []
-    bar_colors = []
-    hover_texts = []
-    annotations = []
-
-    for region in REGION_ORDER:
-        d = data.get(region, {})
-        status = d.get("status", "no_data")
+    return {"chart": chart, "caption": " · ".join(annotations)}
 
-        if status == "active" and d.get("total_events", 0) > 0:
-            regions_show.append(REGION_SHORT[region])
-            total = d["total_events"]
-            values.append(total)
-            bar_colors.append(REGION_COLORS[region])
-            teachers = d.get("unique_teachers", 0)
-            per_t = d.get("per_teacher", 0)
-            extra = d.get("type", "")
-            hover = f"Total: {total:,}<br>Teachers: {teachers:,}<br>Per teacher: {per_t}"
-            if extra:
-                hover += f"<br>Type: {extra}"
-            hover_texts.append(hover)
-        else:
-            annotations.append(f"**{REGION_SHORT[region]}**: No data")
-
-    if values:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            y=regions_show, x=values,
-            orientation="h",
-            marker_color=bar_colors,
-            text=[f"{v:,}" for v in values],
-            textposition="outside",
-            hovertext=hover_texts,
-            hoverinfo="text",
-        ))
-
-        base_layout = plotly_layout_defaults(height=220)
-        base_layout["margin"] = dict(t=10, b=40, l=100, r=80)
-        base_layout["yaxis"] = dict(autorange="reversed")
-        base_layout["showlegend"] = False
-        fig.update_layout(**base_layout)
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
-
-    if annotations:
-        st.caption(" · ".join(annotations))
 
+def _render_observations_subsection(data: dict):
+    _metric_definition_expander("observations")
 
-def _render_training_subsection():
-    st.markdown(
-        '<div style="font-size: 0.875rem; font-weight: 600; color: #374151; '
-        'margin-bottom: 0.5rem;">2c. Teacher Training Engagement</div>',
-        unsafe_allow_html=True
-    )
-    _metric_definition_expander("training")
+    view = _prepare_observations(data)
+    if view["chart"]:
+        _render_figure(view["chart"])
+    if view["caption"]:
+        st.caption(view["caption"])
+
+
+# Per-subsection settings for the horizontal-bar engagement charts (2b, 2c)
+_HBAR_SUBSECTIONS = {
+    "lp": {
+        "definition": "lp_engagement",
+        "value_key": "total_events",
+        "value_label": "Total",
+        "show_type": True,
+        "not_applicable": "no_data",
+    },
+    "training": {
+        "definition": "training",
+        "value_key": "total_submissions",
+        "value_label": "Submissions",
+        "show_type": False,
+        "not_applicable": "coaching_only",
+    },
+}
 
-    data = get_training_metrics()
 
+def _prepare_hbar(name: str, data: dict) -> dict:
+    spec = _HBAR_SUBSECTIONS[name]
     regions_show = []
     values = []
     bar_colors = []
-    hover_texts = []
+    details = []
     annotations = []
+    labels = _status_labels()
 
-    for region in REGION_ORDER:
+    for region, short_name, color in _REGION_META:
         d = data.get(region, {})
         status = d.get("status", "no_data")
+        total = d.get(spec["value_key"], 0) or 0
 
-        if status == "not_applicable":
-            annotations.append(f"**{REGION_SHORT[region]}**: N/A (coaching only)")
-            continue
-
-        total = d.get("total_submissions", 0) or 0
         if status == "active" and total > 0:
-            regions_show.append(REGION_SHORT[region])
+            regions_show.append(short_name)
             values.append(total)
-            bar_colors.append(REGION_COLORS[region])
-            teachers = d.get("unique_teachers", 0)
-            per_t = d.get("per_teacher", 0)
-            hover_texts.append(
-                f"Submissions: {total:,}<br>Teachers: {teachers:,}<br>Per teacher: {per_t}"
-            )
+            bar_colors.append(color)
+            details.append((
+                d.get("unique_teachers", 0),
+                d.get("per_teacher", 0),
+                d.get("type", "") if spec["show_type"] else "",
+            ))
+        elif status == "not_applicable":
+            annotations.append(labels[(region, spec["not_applicable"])])
         else:
-            annotations.append(f"**{REGION_SHORT[region]}**: No data")
+            annotations.append(labels[(region, "no_data")])
 
+    chart = None
     if values:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            y=regions_show, x=values,
-            orientation="h",
-            marker_color=bar_colors,
-            text=[f"{v:,}" for v in values],
-            textposition="outside",
-            hovertext=hover_texts,
-            hoverinfo="text",
-        ))
+        chart = _build_hbar_fig(
+            spec["value_label"],
+            tuple(regions_show), tuple(values), tuple(bar_colors), tuple(details)
+        )
+    return {"chart": chart, "caption": " · ".join(annotations)}
 
-        base_layout = plotly_layout_defaults(height=220)
-        base_layout["margin"] = dict(t=10, b=40, l=100, r=80)
-        base_layout["yaxis"] = dict(autorange="reversed")
-        base_layout["showlegend"] = False
-        fig.update_layout(**base_layout)
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
 
-    if annotations:
-        st.caption(" · ".join(annotations))
+def _render_hbar_subsection(name: str, data: dict):
+    _metric_definition_expander(_HBAR_SUBSECTIONS[name]["definition"])
 
+    view = _prepare_hbar(name, data)
+    if view["chart"]:
+        _render_figure(view["chart"])
+    if view["caption"]:
+        st.caption(view["caption"])
 
-def _render_fico_subsection():
-    st.markdown(
-        '<div style="font-size: 0.875rem; font-weight: 600; color: #374151; '
-        'margin-bottom: 0.5rem;">2d. FICO Scores by Section (B, C, D)</div>',
-        unsafe_allow_html=True
+
+@st.cache_data(show_spinner=False)
+def _fico_insight_html(ict_d_avg: int, bal_d_avg: int) -> str:
+    """Build the ICT vs Balochistan FICO insight card, keyed on rounded Section D averages."""
+    return insight_card(
+        f"ICT uses <strong>TEACH Tool (human observers)</strong> while Balochistan uses "
+        f"<strong>AI + Human</strong> scoring. "
+        f"Section D (Participation) is weakest across both: "
+        f"ICT {ict_d_avg}%, Balochistan {bal_d_avg}%.",
+        title="Cross-Region FICO Comparison"
     )
-    _metric_definition_expander("fico")
 
-    data = get_fico_metrics()
 
+def _prepare_fico(data: dict) -> dict:
     regions_with_data = []
     annotations = []
-
-    for region in REGION_ORDER:
-        d = data.get(region, {})
-        status = d.get("status", "no_data")
+    labels = _status_labels()
+
+    for region, short_name, color in _REGION_META:
+        region_data = data.get(region, {})
+        status = region_data.get("status", "no_data")
+        # Sections with no scored items average to 0; don't chart them as data
+        if status == "active" and not any(region_data.get(k) for k in ("b_avg", "c_avg", "d_avg")):
+            status = "no_data"
         if status == "active":
-            regions_with_data.append(region)
-        elif status == "not_applicable":
-            annotations.append(f"**{REGION_SHORT[region]}**: N/A")
-        elif status == "launching_q2_2026":
-            annotations.append(f"**{REGION_SHORT[region]}**: Launching Q2 2026")
+            regions_with_data.append((region, short_name, color))
         else:
-            annotations.append(f"**{REGION_SHORT[region]}**: No data")
+            annotations.append(labels.get((region, status), labels[(region, "no_data")]))
 
+    chart = None
+    insight = None
     if regions_with_data:
-        sections = ["Section B", "Section C", "Section D"]
-        fig = go.Figure()
-        for region in regions_with_data:
-            d = data[region]
-            fig.add_trace(go.Bar(
-                x=sections,
-                y=[d.get("b_avg", 0), d.get("c_avg", 0), d.get("d_avg", 0)],
-                name=f"{REGION_SHORT[region]} ({d.get('type', '')})",
-                marker_color=REGION_COLORS[region],
-                text=[
-                    f"{d.get('b_avg', 0):.0f}%",
-                    f"{d.get('c_avg', 0):.0f}%",
-                    f"{d.get('d_avg', 0):.0f}%",
-                ],
-                textposition="outside",
-            ))
-
-        base_layout = plotly_layout_defaults(height=300)
-        base_layout["barmode"] = "group"
-        base_layout["yaxis"] = dict(range=[0, 100], ticksuffix="%")
-        base_layout["legend"] = dict(
-            orientation="h", yanchor="bottom", y=1.02,
-            xanchor="right", x=1, font=dict(size=11)
-        )
-        fig.update_layout(**base_layout)
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+        chart = _build_fico_fig(tuple(
+            (
+                f"{short_name} ({data[region].get('type', '')})",
+                color,
+                data[region].get("b_avg", 0),
+                data[region].get("c_avg", 0),
+                data[region].get("d_avg", 0),
+            )
+            for region, short_name, color in regions_with_data
+        ))
 
         # Cross-region insight
-        if "ICT" in regions_with_data and "Balochistan" in regions_with_data:
-            ict_d = data["ICT"]
-            bal_d = data["Balochistan"]
-            st.markdown(
-                insight_card(
-                    f"ICT uses <strong>TEACH Tool (human observers)</strong> while Balochistan uses "
-                    f"<strong>AI + Human</strong> scoring. "
-                    f"Section D (Participation) is weakest across both: "
-                    f"ICT {ict_d.get('d_avg', 0):.0f}%, Balochistan {bal_d.get('d_avg', 0):.0f}%.",
-                    title="Cross-Region FICO Comparison"
-                ),
-                unsafe_allow_html=True
+        charted = {region for region, _, _ in regions_with_data}
+        if "ICT" in charted and "Balochistan" in charted:
+            insight = _fico_insight_html(
+                round(data["ICT"].get("d_avg", 0)),
+                round(data["Balochistan"].get("d_avg", 0)),
             )
+    return {"chart": chart, "insight": insight, "caption": " · ".join(annotations)}
+
+
+def _render_fico_subsection(data: dict):
+    _metric_definition_expander("fico")
+
+    view = _prepare_fico(data)
+    if view["chart"]:
+        _render_figure(view["chart"])
+        if view["insight"]:
+            st.markdown(view["insight"], unsafe_allow_html=True)
     else:
         st.info("FICO score data is only available for regions with classroom observations (ICT and Balochistan).")
 
-    if annotations:
-        st.caption(" · ".join(annotations))
+    if view["caption"]:
+        st.caption(view["caption"])
 
 
 # =============================================================================
@@ -508,186 +632,179 @@ def _render_fico_subsection():
 # =============================================================================
 
 def _render_student_learning():
-    st.markdown(section_title("3. Student Learning"), unsafe_allow_html=True)
     _metric_definition_expander("student_learning")
 
+    # Subsections 3b-3e carry their own top margin in place of spacer elements
     # --- 3a. ICT: Effect Size ---
     _render_ict_learning()
-    st.markdown("")
 
     # --- 3b. Moawin: Subject Scores ---
     _render_moawin_learning()
-    st.markdown("")
 
     # --- 3c. Rumi: Reading Assessments ---
     _render_rumi_learning()
-    st.markdown("")
 
     # --- 3d. Balochistan: Student Participation ---
     _render_balochistan_learning()
-    st.markdown("")
 
     # --- 3e. RWP: No data yet ---
     _render_rwp_learning()
 
 
+# Static learning cards: built once per script run and emitted as one flex row
+_LEARNING_CARD_STYLE = (
+    'flex: 1; background: white; border-radius: 10px; padding: 1.25rem; '
+    'text-align: center; box-shadow: 0 1px 3px rgba(0,0,0,0.04);'
+)
+
+_ICT_LEARNING_HTML = (
+    '<div style="display: flex; gap: 1rem;">'
+    f'<div style="{_LEARNING_CARD_STYLE} border-top: 3px solid {REGION_COLORS["ICT"]};">'
+    f'<div style="font-size: 2.5rem; font-weight: 700; color: {REGION_COLORS["ICT"]};">0.46</div>'
+    '<div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.25rem;">'
+    'Effect Size (Cohen\'s d)</div>'
+    '<div style="font-size: 0.6875rem; color: #9CA3AF; margin-top: 0.5rem;">'
+    'RCT-validated · Medium-to-large</div>'
+    '</div>'
+    f'<div style="{_LEARNING_CARD_STYLE}">'
+    '<div style="font-size: 2.5rem; font-weight: 700; color: #10B981;">$50-100</div>'
+    '<div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.25rem;">'
+    'Cost Per Teacher</div>'
+    '<div style="font-size: 0.6875rem; color: #9CA3AF; margin-top: 0.5rem;">'
+    '20-50x cheaper than coaching</div>'
+    '</div>'
+    f'<div style="{_LEARNING_CARD_STYLE}">'
+    '<div style="font-size: 2.5rem; font-weight: 700; color: #374151;">10.2%</div>'
+    '<div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.25rem;">'
+    'Improvement in Observation Scores</div>'
+    '<div style="font-size: 0.6875rem; color: #9CA3AF; margin-top: 0.5rem;">'
+    'Certified vs non-certified teachers</div>'
+    '</div>'
+    '</div>'
+)
+
+_RUMI_LEARNING_HTML = (
+    '<div style="display: flex; gap: 1rem;">'
+    f'<div style="{_LEARNING_CARD_STYLE} border-top: 3px solid {REGION_COLORS["Rumi"]};">'
+    f'<div style="font-size: 2.5rem; font-weight: 700; color: {REGION_COLORS["Rumi"]};">197</div>'
+    '<div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.25rem;">'
+    'WCPM Assessments</div>'
+    '<div style="font-size: 0.6875rem; color: #9CA3AF; margin-top: 0.5rem;">'
+    'Words Correct Per Minute</div>'
+    '</div>'
+    f'<div style="{_LEARNING_CARD_STYLE}">'
+    '<div style="font-size: 2.5rem; font-weight: 700; color: #F59E0B;">34%</div>'
+    '<div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.25rem;">'
+    'At Grade Level</div>'
+    '<div style="font-size: 0.6875rem; color: #9CA3AF; margin-top: 0.5rem;">'
+    'Reading at expected fluency</div>'
+    '</div>'
+    f'<div style="{_LEARNING_CARD_STYLE}">'
+    '<div style="font-size: 2.5rem; font-weight: 700; color: #374151;">52</div>'
+    '<div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.25rem;">'
+    'Avg WCPM</div>'
+    '<div style="font-size: 0.6875rem; color: #9CA3AF; margin-top: 0.5rem;">'
+    'Average words correct per minute</div>'
+    '</div>'
+    '</div>'
+)
+
+# Pass-rate color: below 50, 50-70, 70 and above
+_PASS_RATE_THRESHOLDS = (50, 70)
+_PASS_RATE_COLORS = ("#EF4444", "#F59E0B", "#10B981")
+
+_MOAWIN_CARD_TPL = (
+    '<div style="flex: 1; background: white; border-radius: 8px; padding: 1rem; '
+    'text-align: center; box-shadow: 0 1px 2px rgba(0,0,0,0.04);">'
+    f'<div style="font-size: 1.5rem; font-weight: 700; color: {REGION_COLORS["Moawin"]};">'
+    '{avg_score:.0f}%</div>'
+    '<div style="font-size: 0.75rem; font-weight: 600; color: #374151; margin-top: 0.25rem;">'
+    '{subject}</div>'
+    '<div style="font-size: 0.6875rem; color: {pass_color}; margin-top: 0.25rem;">'
+    '{pass_rate:.0f}% pass rate</div>'
+    '<div style="font-size: 0.625rem; color: #D1D5DB; margin-top: 0.25rem;">'
+    '{count:,} assessments</div>'
+    '</div>'
+)
+
 def _render_ict_learning():
     st.markdown(
         '<div style="font-size: 0.875rem; font-weight: 600; color: #374151; '
         'margin-bottom: 0.5rem;">3a. ICT — RCT Learning Impact</div>',
         unsafe_allow_html=True
     )
-
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown(
-            f'<div style="background: white; border-radius: 10px; padding: 1.25rem; '
-            f'text-align: center; box-shadow: 0 1px 3px rgba(0,0,0,0.04); '
-            f'border-top: 3px solid {REGION_COLORS["ICT"]};">'
-            f'<div style="font-size: 2.5rem; font-weight: 700; color: {REGION_COLORS["ICT"]};">0.46</div>'
-            f'<div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.25rem;">'
-            f'Effect Size (Cohen\'s d)</div>'
-            f'<div style="font-size: 0.6875rem; color: #9CA3AF; margin-top: 0.5rem;">'
-            f'RCT-validated · Medium-to-large</div>'
-            f'</div>',
-            unsafe_allow_html=True
-        )
-    with col2:
-        st.markdown(
-            '<div style="background: white; border-radius: 10px; padding: 1.25rem; '
-            'text-align: center; box-shadow: 0 1px 3px rgba(0,0,0,0.04);">'
-            '<div style="font-size: 2.5rem; font-weight: 700; color: #10B981;">$50-100</div>'
-            '<div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.25rem;">'
-            'Cost Per Teacher</div>'
-            '<div style="font-size: 0.6875rem; color: #9CA3AF; margin-top: 0.5rem;">'
-            '20-50x cheaper than coaching</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    with col3:
-        st.markdown(
-            '<div style="background: white; border-radius: 10px; padding: 1.25rem; '
-            'text-align: center; box-shadow: 0 1px 3px rgba(0,0,0,0.04);">'
-            '<div style="font-size: 2.5rem; font-weight: 700; color: #374151;">10.2%</div>'
-            '<div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.25rem;">'
-            'Improvement in Observation Scores</div>'
-            '<div style="font-size: 0.6875rem; color: #9CA3AF; margin-top: 0.5rem;">'
-            'Certified vs non-certified teachers</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
+    st.markdown(_ICT_LEARNING_HTML, unsafe_allow_html=True)
 
 
 def _render_moawin_learning():
     st.markdown(
         '<div style="font-size: 0.875rem; font-weight: 600; color: #374151; '
-        'margin-bottom: 0.5rem;">3b. Moawin — Student Assessment Scores</div>',
+        'margin-top: 1.5rem; margin-bottom: 0.5rem;">3b. Moawin — Student Assessment Scores</div>',
         unsafe_allow_html=True
     )
 
-    scores = moawin_queries.get_student_scores_by_subject()
+    scores = get_student_learning_metrics().get("Moawin", {}).get("subjects", [])
     if not scores:
-        st.markdown(_no_data_html("Moawin", "No student assessment data available"), unsafe_allow_html=True)
+        st.markdown(NO_DATA_HTML["moawin_scores"], unsafe_allow_html=True)
         return
 
-    # Subject score cards
-    cols = st.columns(len(scores))
-    for i, s in enumerate(scores):
-        with cols[i]:
-            pass_color = "#10B981" if s["pass_rate"] >= 70 else "#F59E0B" if s["pass_rate"] >= 50 else "#EF4444"
-            st.markdown(
-                f'<div style="background: white; border-radius: 8px; padding: 1rem; '
-                f'text-align: center; box-shadow: 0 1px 2px rgba(0,0,0,0.04);">'
-                f'<div style="font-size: 1.5rem; font-weight: 700; color: {REGION_COLORS["Moawin"]};">'
-                f'{s["avg_score"]:.0f}%</div>'
-                f'<div style="font-size: 0.75rem; font-weight: 600; color: #374151; margin-top: 0.25rem;">'
-                f'{s["subject"]}</div>'
-                f'<div style="font-size: 0.6875rem; color: {pass_color}; margin-top: 0.25rem;">'
-                f'{s["pass_rate"]:.0f}% pass rate</div>'
-                f'<div style="font-size: 0.625rem; color: #D1D5DB; margin-top: 0.25rem;">'
-                f'{s["count"]:,} assessments</div>'
-                f'</div>',
-                unsafe_allow_html=True
-            )
+    # Subject score cards, emitted as one flex row
+    cards_html = "".join(
+        _MOAWIN_CARD_TPL.format(
+            **s,
+            pass_color=_PASS_RATE_COLORS[bisect_right(_PASS_RATE_THRESHOLDS, s["pass_rate"])],
+        )
+        for s in scores
+    )
+    st.markdown(f'<div style="display: flex; gap: 1rem;">{cards_html}</div>', unsafe_allow_html=True)
 
     # Bar chart
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        x=[s["subject"] for s in scores],
-        y=[s["avg_score"] for s in scores],
-        marker_color=REGION_COLORS["Moawin"],
-        text=[f'{s["avg_score"]:.0f}%' for s in scores],
-        textposition="outside",
-    ))
-    base_layout = plotly_layout_defaults(height=250)
-    base_layout["yaxis"] = dict(range=[0, 100], ticksuffix="%")
-    base_layout["showlegend"] = False
-    fig.update_layout(**base_layout)
-    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+    _render_figure(_build_moawin_scores_fig(tuple((s["subject"], s["avg_score"]) for s in scores)))
 
 
 def _render_rumi_learning():
     st.markdown(
         '<div style="font-size: 0.875rem; font-weight: 600; color: #374151; '
-        'margin-bottom: 0.5rem;">3c. Rumi — WCPM Reading Assessments</div>',
+        'margin-top: 1.5rem; margin-bottom: 0.5rem;">3c. Rumi — WCPM Reading Assessments</div>',
         unsafe_allow_html=True
     )
+    st.markdown(_RUMI_LEARNING_HTML, unsafe_allow_html=True)
 
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown(
-            f'<div style="background: white; border-radius: 10px; padding: 1.25rem; '
-            f'text-align: center; box-shadow: 0 1px 3px rgba(0,0,0,0.04); '
-            f'border-top: 3px solid {REGION_COLORS["Rumi"]};">'
-            f'<div style="font-size: 2.5rem; font-weight: 700; color: {REGION_COLORS["Rumi"]};">197</div>'
-            f'<div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.25rem;">'
-            f'WCPM Assessments</div>'
-            f'<div style="font-size: 0.6875rem; color: #9CA3AF; margin-top: 0.5rem;">'
-            f'Words Correct Per Minute</div>'
-            f'</div>',
-            unsafe_allow_html=True
-        )
-    with col2:
-        st.markdown(
-            '<div style="background: white; border-radius: 10px; padding: 1.25rem; '
-            'text-align: center; box-shadow: 0 1px 3px rgba(0,0,0,0.04);">'
-            '<div style="font-size: 2.5rem; font-weight: 700; color: #F59E0B;">34%</div>'
-            '<div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.25rem;">'
-            'At Grade Level</div>'
-            '<div style="font-size: 0.6875rem; color: #9CA3AF; margin-top: 0.5rem;">'
-            'Reading at expected fluency</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    with col3:
-        st.markdown(
-            '<div style="background: white; border-radius: 10px; padding: 1.25rem; '
-            'text-align: center; box-shadow: 0 1px 3px rgba(0,0,0,0.04);">'
-            '<div style="font-size: 2.5rem; font-weight: 700; color: #374151;">52</div>'
-            '<div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.25rem;">'
-            'Avg WCPM</div>'
-            '<div style="font-size: 0.6875rem; color: #9CA3AF; margin-top: 0.5rem;">'
-            'Average words correct per minute</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
 
+FICO_D_LABELS = {
+    "D1": "Students ask questions",
+    "D2": "Students show interest",
+    "D3": "Students lead activities",
+    "D4": "Students collaborate",
+    "D5": "Students present work",
+    "D6": "Students evaluate peers",
+}
 
-def _render_balochistan_learning():
-    st.markdown(
-        '<div style="font-size: 0.875rem; font-weight: 600; color: #374151; '
-        'margin-bottom: 0.5rem;">3d. Balochistan — Student Participation (from Observations)</div>',
-        unsafe_allow_html=True
-    )
+# FICO Section D indicator color: red below 25, amber below 50, green otherwise
+_FICO_D_THRESHOLDS = (25, 50)
+_FICO_D_COLORS = ("#EF4444", "#F59E0B", "#10B981")
 
+
+@st.cache_resource(show_spinner=False)
+def _balochistan_learning_html() -> dict:
+    """
+    Build the Balochistan learning blocks from BALOCHISTAN_KNOWN_VALUES, once per process.
+
+    Returns:
+        Dict with cards (talk time + question types), fico_d_rows and insight HTML
+    """
     known = balochistan_queries.BALOCHISTAN_KNOWN_VALUES
 
-    # Talk time and question type cards
-    col1, col2 = st.columns(2)
+    total_q = known["avg_open_questions"] + known["avg_closed_questions"]
+    closed_pct = round(known["avg_closed_questions"] / total_q * 100) if total_q > 0 else 87
+    open_pct = 100 - closed_pct
+
+    fico_d = known.get("fico_d", {})
 
-    with col1:
-        st.markdown(
-            '<div style="background: white; border-radius: 10px; padding: 1.25rem; '
+    return {
+        "cards": (
+            '<div style="display: flex; gap: 1rem;">'
+            '<div style="flex: 1; background: white; border-radius: 10px; padding: 1.25rem; '
             'box-shadow: 0 1px 3px rgba(0,0,0,0.04);">'
             '<div style="font-size: 0.6875rem; font-weight: 600; color: #9CA3AF; '
             'text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.75rem;">'
@@ -705,16 +822,8 @@ def _render_balochistan_learning():
             f'</div>'
             f'<div style="font-size: 0.625rem; color: #D1D5DB; margin-top: 0.75rem; text-align: center;">'
             f'Target: 40% student talk time</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-
-    with col2:
-        total_q = known["avg_open_questions"] + known["avg_closed_questions"]
-        closed_pct = round(known["avg_closed_questions"] / total_q * 100) if total_q > 0 else 87
-        open_pct = 100 - closed_pct
-        st.markdown(
-            '<div style="background: white; border-radius: 10px; padding: 1.25rem; '
+            '</div>'
+            '<div style="flex: 1; background: white; border-radius: 10px; padding: 1.25rem; '
             'box-shadow: 0 1px 3px rgba(0,0,0,0.04);">'
             '<div style="font-size: 0.6875rem; font-weight: 600; color: #9CA3AF; '
             'text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 0.75rem;">'
@@ -729,35 +838,18 @@ def _render_balochistan_learning():
             f'</div>'
             f'<div style="font-size: 0.625rem; color: #D1D5DB; margin-top: 0.75rem; text-align: center;">'
             f'Avg {known["avg_open_questions"]} open vs {known["avg_closed_questions"]} closed per class</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-
-    # FICO Section D indicators chart
-    st.markdown(
-        '<div style="font-size: 0.75rem; font-weight: 600; color: #6B7280; '
-        'margin-top: 1rem; margin-bottom: 0.5rem;">'
-        'FICO Section D — Student Participation Indicators</div>',
-        unsafe_allow_html=True
-    )
-
-    fico_d = known.get("fico_d", {})
-    d_labels = {
-        "D1": "Students ask questions",
-        "D2": "Students show interest",
-        "D3": "Students lead activities",
-        "D4": "Students collaborate",
-        "D5": "Students present work",
-        "D6": "Students evaluate peers",
-    }
-
-    for indicator, score in fico_d.items():
-        label = d_labels.get(indicator, indicator)
-        color = "#10B981" if score >= 50 else "#F59E0B" if score >= 25 else "#EF4444"
-        st.markdown(grade_row(f"{indicator}: {label}", score, color), unsafe_allow_html=True)
-
-    st.markdown(
-        insight_card(
+            '</div>'
+            '</div>'
+        ),
+        "fico_d_rows": grade_rows([
+            (
+                f"{indicator}: {FICO_D_LABELS.get(indicator, indicator)}",
+                score,
+                _FICO_D_COLORS[bisect_right(_FICO_D_THRESHOLDS, score)],
+            )
+            for indicator, score in fico_d.items()
+        ]),
+        "insight": insight_card(
             f"Student participation is critically low across all D indicators. "
             f"D6 (peer evaluation) scores <strong>0%</strong>, D3 (student-led activities) "
             f"only <strong>6%</strong>. Combined with only <strong>{known['student_talk_time']}% "
@@ -765,20 +857,40 @@ def _render_balochistan_learning():
             title="Balochistan Participation Gap",
             border_color=REGION_COLORS["Balochistan"]
         ),
+    }
+
+
+def _render_balochistan_learning():
+    st.markdown(
+        '<div style="font-size: 0.875rem; font-weight: 600; color: #374151; '
+        'margin-top: 1.5rem; margin-bottom: 0.5rem;">3d. Balochistan — Student Participation (from Observations)</div>',
         unsafe_allow_html=True
     )
 
+    blocks = _balochistan_learning_html()
 
-def _render_rwp_learning():
+    # Talk time and question type cards, side by side in one flex row
+    st.markdown(blocks["cards"], unsafe_allow_html=True)
+
+    # FICO Section D indicators chart
     st.markdown(
-        '<div style="font-size: 0.875rem; font-weight: 600; color: #374151; '
-        'margin-bottom: 0.5rem;">3e. Rawalpindi — Student Learning</div>',
+        '<div style="font-size: 0.75rem; font-weight: 600; color: #6B7280; '
+        'margin-top: 1rem; margin-bottom: 0.5rem;">'
+        'FICO Section D — Student Participation Indicators</div>',
         unsafe_allow_html=True
     )
+    st.markdown(blocks["fico_d_rows"], unsafe_allow_html=True)
+
+    st.markdown(blocks["insight"], unsafe_allow_html=True)
+
+
+def _render_rwp_learning():
     st.markdown(
-        _no_data_html("Rawalpindi", "No data yet — launching Q2 2026"),
+        '<div style="font-size: 0.875rem; font-weight: 600; color: #374151; '
+        'margin-top: 1.5rem; margin-bottom: 0.5rem;">3e. Rawalpindi — Student Learning</div>',
         unsafe_allow_html=True
     )
+    st.markdown(NO_DATA_HTML["rwp_learning"], unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
@@ -46,6 +46,10 @@ REGIONS = {
 }
 
 
+# Tab labels in tab order, built once at import
+TAB_LABELS = [f"{info['icon']} {region}" for region, info in REGIONS.items()]
+
+
 def render_region_tabs() -> Tuple:
     """
     Render the 5 region tabs.
@@ -53,13 +57,7 @@ def render_region_tabs() -> Tuple:
     Returns:
         Tuple of 5 tab containers (ict, balochistan, rwp, moawin, rumi)
     """
-    return st.tabs([
-        f"{REGIONS['ICT']['icon']} ICT",
-        f"{REGIONS['Balochistan']['icon']} Balochistan",
-        f"{REGIONS['Rawalpindi']['icon']} Rawalpindi",
-        f"{REGIONS['Moawin']['icon']} Moawin",
-        f"{REGIONS['Rumi']['icon']} Rumi"
-    ])
+    return st.tabs(TAB_LABELS)
 
 
 def get_region_info(region: str) -> dict:
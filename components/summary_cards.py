@@ -2,15 +2,24 @@
 Summary cards component showing key metrics.
 Uses centralized design system for consistent styling.
 """
-import streamlit as st
-from pathlib import Path
-import sys
+from functools import lru_cache
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import streamlit as st
 
 from data.queries import get_summary_metrics
-from styles.design_system import metric_card, COLORS
+from styles.design_system import metric_row, COLORS
+
+
+@lru_cache(maxsize=256)
+def _fmt_int(n: int) -> str:
+    """Format a count with thousands separators."""
+    return f"{n:,}"
+
+
+@lru_cache(maxsize=256)
+def _fmt_pct(v: float) -> str:
+    """Format a percentage value for display."""
+    return f"{v}%"
 
 
 def render_summary_cards(filters: dict):
@@ -23,9 +32,6 @@ def render_summary_cards(filters: dict):
     # Get metrics (will be replaced with live data)
     metrics = get_summary_metrics(filters)
 
-    # Create 6-column layout for cards
-    cols = st.columns(6)
-
     cards = [
         {
             "label": "Schools",
@@ -49,19 +55,21 @@ def render_summary_cards(filters: dict):
         },
         {
             "label": "Avg Score",
-            "value": f"{metrics.get('avg_score', 72.3)}%",
+            "value": _fmt_pct(metrics.get('avg_score', 72.3)),
             "color": COLORS['success']
         },
         {
             "label": "Students",
-            "value": f"{metrics.get('students', 16898):,}",
+            "value": _fmt_int(metrics.get('students', 16898)),
             "color": None
         }
     ]
 
-    for col, card in zip(cols, cards):
-        with col:
-            st.markdown(
-                metric_card(card["value"], card["label"], card.get("color")),
-                unsafe_allow_html=True
-            )
+    # Single 6-column grid instead of one element per st.columns cell
+    st.markdown(
+        metric_row(
+            [(card["value"], card["label"], card.get("color")) for card in cards],
+            columns=6,
+        ),
+        unsafe_allow_html=True
+    )
@@ -1,14 +1,8 @@
 # Data package
-from .queries import (
-    get_summary_metrics,
-    get_fico_section_c_metrics,
-    get_fico_section_d_metrics,
-    get_observation_counts,
-    get_observation_trend,
-    get_recent_sessions,
-    get_student_scores_by_subject,
-    get_attendance_trend
-)
+# The query router is imported on first attribute access (PEP 562), so
+# importing a submodule such as data.common_metrics doesn't load every
+# regional query module with it.
+import importlib
 
 __all__ = [
     'get_summary_metrics',
@@ -20,3 +14,11 @@ __all__ = [
     'get_student_scores_by_subject',
     'get_attendance_trend'
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        value = getattr(importlib.import_module('.queries', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
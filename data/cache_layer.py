@@ -1,11 +1,17 @@
 """
 Caching layer for the observability dashboard.
 Tracks data freshness and provides cache clearing utilities.
-All query functions use @st.cache_data(ttl=28800) for 8-hour TTL.
+The data.queries routers and the common metric getters use
+@st.cache_data(ttl=28800) for an 8-hour TTL; the regional *_queries
+modules below them are uncached. The batched dashboard metrics sit behind
+a process-wide stale_while_revalidate store on top of those caches.
 """
+import functools
+import threading
+import time
 import streamlit as st
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Optional
 
 
 # Cache TTL: 8 hours (28800 seconds)
@@ -19,23 +25,87 @@ def get_last_refresh_time() -> str:
     return st.session_state["last_refresh"].strftime("%d %b %Y, %I:%M %p")
 
 
+@st.cache_resource(show_spinner=False)
+def _swr_store() -> dict:
+    """Process-wide stale-while-revalidate entries, shared by all sessions."""
+    return {"lock": threading.Lock(), "entries": {}}
+
+
 def clear_all_caches():
     """Clear all cached data to force refresh."""
     st.cache_data.clear()
+    store = _swr_store()
+    with store["lock"]:
+        store["entries"].clear()
     st.session_state["last_refresh"] = datetime.now()
 
 
+def stale_while_revalidate(
+    fresh_ttl: int = CACHE_TTL,
+    stale_ttl: int = 3 * CACHE_TTL,
+    before_refresh: Optional[Callable[[], None]] = None,
+):
+    """
+    Cache a zero-argument loader process-wide, serving stale values while refreshing.
+
+    Values younger than fresh_ttl are returned as-is. Values younger than
+    stale_ttl are returned immediately while a background thread refetches
+    them for the next rerun. Older (or missing) values are fetched inline.
+
+    Args:
+        fresh_ttl: Seconds a value is served without refreshing
+        stale_ttl: Seconds a value may be served while a refresh runs
+        before_refresh: Called before a background refetch, e.g. to clear
+            the st.cache_data entries the loader reads through
+    """
+    def decorator(func: Callable[[], Any]) -> Callable[[], Any]:
+        key = f"{func.__module__}.{func.__qualname__}"
+
+        def refresh(entry: dict, lock: threading.Lock):
+            # Runs without a script context: only touch the entry dict,
+            # never st.session_state.
+            try:
+                if before_refresh is not None:
+                    before_refresh()
+                value = func()
+                with lock:
+                    entry["value"] = value
+                    entry["fetched_at"] = time.monotonic()
+            finally:
+                entry["refreshing"] = False
+
+        @functools.wraps(func)
+        def wrapper():
+            store = _swr_store()
+            lock, entries = store["lock"], store["entries"]
+
+            with lock:
+                entry = entries.get(key)
+                age = time.monotonic() - entry["fetched_at"] if entry else None
+                if entry is not None and age < stale_ttl:
+                    if age >= fresh_ttl and not entry["refreshing"]:
+                        entry["refreshing"] = True
+                        threading.Thread(
+                            target=refresh, args=(entry, lock), daemon=True
+                        ).start()
+                    return entry["value"]
+
+            value = func()
+            with lock:
+                entries[key] = {"value": value, "fetched_at": time.monotonic(), "refreshing": False}
+            return value
+
+        return wrapper
+    return decorator
+
+
 def data_freshness_banner() -> str:
     """Generate HTML for the data freshness banner."""
     refresh_time = get_last_refresh_time()
     return (
-        '<div style="background: #F0FDF4; border: 1px solid #BBF7D0; border-radius: 8px; '
-        'padding: 0.5rem 1rem; margin-bottom: 1rem; display: flex; align-items: center; '
-        'justify-content: space-between;">'
-        '<div style="display: flex; align-items: center; gap: 0.5rem;">'
-        '<span style="color: #16A34A; font-size: 0.625rem;">&#9679;</span>'
-        f'<span style="font-size: 0.75rem; color: #166534;">Data refreshed: {refresh_time}</span>'
-        '</div>'
-        '<span style="font-size: 0.6875rem; color: #6B7280;">5 databases connected</span>'
+        '<div class="freshness-banner">'
+        '<span class="freshness-banner-dot">&#9679;</span>'
+        f'<span>Data refreshed: {refresh_time}</span>'
+        '<span class="freshness-banner-sources">5 databases connected</span>'
         '</div>'
     )
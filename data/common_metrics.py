@@ -9,6 +9,7 @@ Provides 6 standardized metrics across all 5 regions:
   6. Student Learning
 """
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from . import (
     islamabad_queries,
@@ -18,6 +19,7 @@ from . import (
     rumi_queries,
 )
 from .db_connections import query_islamabad, query_rumi, query_moawin_direct
+from .cache_layer import stale_while_revalidate
 
 CACHE_TTL = 28800  # 8 hours
 
@@ -138,7 +140,7 @@ REGION_PARAMETERS = {
 # METRIC 1: Observations (vs Benchmark)
 # ============================================================================
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_observation_metrics() -> Dict[str, Dict[str, Any]]:
     """Get observation counts and benchmarks per region."""
     results = {}
@@ -199,7 +201,7 @@ def get_observation_metrics() -> Dict[str, Dict[str, Any]]:
 # METRIC 2: Lesson Plan Engagement
 # ============================================================================
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_lp_engagement_metrics() -> Dict[str, Dict[str, Any]]:
     """Get LP engagement per region."""
     results = {}
@@ -264,7 +266,7 @@ def get_lp_engagement_metrics() -> Dict[str, Dict[str, Any]]:
 # METRIC 3: Teacher Training Engagement
 # ============================================================================
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_training_metrics() -> Dict[str, Dict[str, Any]]:
     """Get training engagement per region."""
     results = {}
@@ -325,7 +327,7 @@ def get_training_metrics() -> Dict[str, Dict[str, Any]]:
 # METRIC 4: Retention (7-day & 30-day)
 # ============================================================================
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_retention_metrics() -> Dict[str, Dict[str, Any]]:
     """Get retention metrics per region."""
     results = {}
@@ -420,48 +422,36 @@ def get_retention_metrics() -> Dict[str, Dict[str, Any]]:
 # METRIC 5: FICO / Observation Scores by Section
 # ============================================================================
 
-@st.cache_data(ttl=CACHE_TTL)
+def _fico_summary(fico: Dict[str, Any], tool_type: str) -> Dict[str, Any]:
+    """
+    Normalize a region's raw FICO scores into the canonical summary dict.
+
+    Args:
+        fico: Dict with section_b/c/d mappings of item -> score
+        tool_type: Observation tool label shown in the chart legend
+
+    Returns:
+        Dict with the raw sections, b_avg/c_avg/d_avg and status
+    """
+    if not fico.get("section_b"):
+        return {"status": "no_data"}
+
+    summary = {"type": tool_type, "status": "active"}
+    for section in ("b", "c", "d"):
+        scores = fico.get(f"section_{section}", {})
+        vals = [v for v in scores.values() if v]
+        summary[f"section_{section}"] = scores
+        summary[f"{section}_avg"] = round(sum(vals) / len(vals), 1) if vals else 0
+    return summary
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_fico_metrics() -> Dict[str, Dict[str, Any]]:
     """Get FICO section scores per region."""
-    results = {}
-
-    # ICT
-    ict_fico = islamabad_queries.get_fico_scores()
-    if ict_fico.get("section_b"):
-        b_vals = [v for v in ict_fico["section_b"].values() if v]
-        c_vals = [v for v in ict_fico["section_c"].values() if v]
-        d_vals = [v for v in ict_fico["section_d"].values() if v]
-        results["ICT"] = {
-            "section_b": ict_fico["section_b"],
-            "section_c": ict_fico["section_c"],
-            "section_d": ict_fico["section_d"],
-            "b_avg": round(sum(b_vals) / len(b_vals), 1) if b_vals else 0,
-            "c_avg": round(sum(c_vals) / len(c_vals), 1) if c_vals else 0,
-            "d_avg": round(sum(d_vals) / len(d_vals), 1) if d_vals else 0,
-            "type": "TEACH Tool (Human)",
-            "status": "active",
-        }
-    else:
-        results["ICT"] = {"status": "no_data"}
-
-    # Balochistan
-    bal_fico = balochistan_queries.get_fico_scores()
-    if bal_fico.get("section_b"):
-        b_vals = [v for v in bal_fico["section_b"].values() if v]
-        c_vals = [v for v in bal_fico["section_c"].values() if v]
-        d_vals = [v for v in bal_fico["section_d"].values() if v]
-        results["Balochistan"] = {
-            "section_b": bal_fico["section_b"],
-            "section_c": bal_fico["section_c"],
-            "section_d": bal_fico["section_d"],
-            "b_avg": round(sum(b_vals) / len(b_vals), 1) if b_vals else 0,
-            "c_avg": round(sum(c_vals) / len(c_vals), 1) if c_vals else 0,
-            "d_avg": round(sum(d_vals) / len(d_vals), 1) if d_vals else 0,
-            "type": "AI (Rumi) + Human",
-            "status": "active",
-        }
-    else:
-        results["Balochistan"] = {"status": "no_data"}
+    results = {
+        "ICT": _fico_summary(islamabad_queries.get_fico_scores(), "TEACH Tool (Human)"),
+        "Balochistan": _fico_summary(balochistan_queries.get_fico_scores(), "AI (Rumi) + Human"),
+    }
 
     results["RWP"] = {"status": "no_data"}
     results["Moawin"] = {"status": "not_applicable"}
@@ -474,7 +464,7 @@ def get_fico_metrics() -> Dict[str, Dict[str, Any]]:
 # METRIC 6: Student Learning
 # ============================================================================
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_student_learning_metrics() -> Dict[str, Dict[str, Any]]:
     """Get student learning metrics per region."""
     results = {}
@@ -537,3 +527,35 @@ def get_all_metrics() -> Dict[str, Any]:
         "parameters": REGION_PARAMETERS,
         "definitions": METRIC_DEFINITIONS,
     }
+
+
+_DASHBOARD_FETCHERS = {
+    "observations": get_observation_metrics,
+    "lp": get_lp_engagement_metrics,
+    "training": get_training_metrics,
+    "fico": get_fico_metrics,
+}
+
+
+def _clear_dashboard_getters():
+    """Drop the getters' 8-hour cache entries so a background refresh re-queries."""
+    for fetch in _DASHBOARD_FETCHERS.values():
+        fetch.clear()
+
+
+@stale_while_revalidate(
+    fresh_ttl=CACHE_TTL, stale_ttl=3 * CACHE_TTL, before_refresh=_clear_dashboard_getters
+)
+def get_all_dashboard_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Get the four Implementation Fidelity metrics in a single cached call.
+
+    The per-metric queries are IO-bound and independent, so they run
+    concurrently: cold-load wall-clock is the slowest query, not the sum.
+
+    Returns:
+        Dict with observations, lp, training, fico region dicts
+    """
+    with ThreadPoolExecutor(max_workers=len(_DASHBOARD_FETCHERS)) as pool:
+        futures = {key: pool.submit(fetch) for key, fetch in _DASHBOARD_FETCHERS.items()}
+        return {key: future.result() for key, future in futures.items()}
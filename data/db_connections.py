@@ -5,6 +5,7 @@ Handles connections to Balochistan, Islamabad, Moawin, and Rumi databases.
 import os
 import base64
 import tempfile
+import threading
 from typing import Optional, Any, Dict
 from functools import lru_cache
 from urllib.parse import urlparse
@@ -142,6 +143,8 @@ ISLAMABAD_CONFIG = {
 }
 
 _bigquery_client = None
+# Dashboard metrics are fetched from a thread pool; serialize client creation
+_bigquery_client_lock = threading.Lock()
 
 
 def get_bigquery_client():
@@ -162,6 +165,16 @@ def get_bigquery_client():
     if _bigquery_client is not None:
         return _bigquery_client
 
+    with _bigquery_client_lock:
+        if _bigquery_client is not None:
+            return _bigquery_client
+        return _create_bigquery_client()
+
+
+def _create_bigquery_client():
+    """Create the shared BigQuery client; caller must hold _bigquery_client_lock."""
+    global _bigquery_client
+
     try:
         # Option 1: Base64-encoded credentials (Railway deployment)
         credentials_b64 = os.environ.get("GOOGLE_CREDENTIALS_JSON")
@@ -7,6 +7,7 @@ Available tables:
 - TEACH_TOOL_OBSERVATION_CLEANED (2,423 observations with FICO scores)
 - Complete_Training_Table (466K+ training records)
 """
+from types import MappingProxyType
 from typing import Dict, Any, List
 from .db_connections import query_islamabad, get_bigquery_client
 
@@ -44,6 +45,15 @@ def get_observation_count() -> int:
     return ISLAMABAD_KNOWN_VALUES["observations"]
 
 
+# SQL predicate per sidebar time period; unknown periods apply no filter
+_TIME_FILTER_SQL = MappingProxyType({
+    "Last 7 Days": "AND observation_date >= DATE_SUB(CURRENT_DATE(), INTERVAL 7 DAY)",
+    "Last 30 Days": "AND observation_date >= DATE_SUB(CURRENT_DATE(), INTERVAL 30 DAY)",
+    "Last 90 Days": "AND observation_date >= DATE_SUB(CURRENT_DATE(), INTERVAL 90 DAY)",
+    "This Year": "AND EXTRACT(YEAR FROM observation_date) = EXTRACT(YEAR FROM CURRENT_DATE())",
+})
+
+
 def get_summary_metrics(time_period: str = "All Time") -> Dict[str, Any]:
     """
     Get summary metrics for Islamabad.
@@ -54,16 +64,7 @@ def get_summary_metrics(time_period: str = "All Time") -> Dict[str, Any]:
     Returns:
         Dict with schools, teachers, observations, avg_score
     """
-    # Build time filter
-    time_filter = ""
-    if time_period == "Last 7 Days":
-        time_filter = "AND observation_date >= DATE_SUB(CURRENT_DATE(), INTERVAL 7 DAY)"
-    elif time_period == "Last 30 Days":
-        time_filter = "AND observation_date >= DATE_SUB(CURRENT_DATE(), INTERVAL 30 DAY)"
-    elif time_period == "Last 90 Days":
-        time_filter = "AND observation_date >= DATE_SUB(CURRENT_DATE(), INTERVAL 90 DAY)"
-    elif time_period == "This Year":
-        time_filter = "AND EXTRACT(YEAR FROM observation_date) = EXTRACT(YEAR FROM CURRENT_DATE())"
+    time_filter = _TIME_FILTER_SQL.get(time_period, "")
 
     sql = f"""
         SELECT
@@ -2,8 +2,12 @@
 Main query router for the observability dashboard.
 Routes queries to appropriate regional modules based on selected filters.
 """
+import streamlit as st
+from types import MappingProxyType
 from typing import Dict, Any, List
 
+from .cache_layer import CACHE_TTL
+
 # Import regional query modules
 from . import balochistan_queries
 from . import moawin_queries
@@ -17,6 +21,7 @@ from . import unified_queries
 # SUMMARY METRICS ROUTER
 # ============================================================================
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_summary_metrics(filters: Dict[str, Any]) -> Dict[str, Any]:
     """
     Get summary metrics based on selected region.
@@ -69,6 +74,18 @@ def get_summary_metrics(filters: Dict[str, Any]) -> Dict[str, Any]:
 # FICO SECTION QUERIES ROUTER
 # ============================================================================
 
+# Region -> query module for the Section C/D routers. Only Balochistan has
+# question and talk time data, so Combined reads from it.
+_FICO_DETAIL_SOURCES = MappingProxyType({
+    "Balochistan": balochistan_queries,
+    "Moawin": moawin_queries,
+    "Islamabad": islamabad_queries,
+    "Rawalpindi": rawalpindi_queries,
+    "Combined": balochistan_queries,
+})
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_fico_section_c_metrics(filters: Dict[str, Any]) -> Dict[str, Any]:
     """
     Get Section C (Checking for Understanding / Question) metrics.
@@ -76,24 +93,9 @@ def get_fico_section_c_metrics(filters: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict with avg_open_questions, avg_closed_questions, open_question_ratio
     """
-    region = filters.get("region", "Combined")
-    obs_type = filters.get("observation_type", "All Observations")
-
-    if region == "Balochistan":
-        return balochistan_queries.get_question_metrics(obs_type)
-
-    elif region == "Moawin":
-        return moawin_queries.get_question_metrics(obs_type)
-
-    elif region == "Islamabad":
-        return islamabad_queries.get_question_metrics(obs_type)
-
-    elif region == "Rawalpindi":
-        return rawalpindi_queries.get_question_metrics(obs_type)
-
-    elif region == "Combined":
-        # Only Balochistan has question data
-        return balochistan_queries.get_question_metrics(obs_type)
+    source = _FICO_DETAIL_SOURCES.get(filters.get("region", "Combined"))
+    if source is not None:
+        return source.get_question_metrics(filters.get("observation_type", "All Observations"))
 
     # Default fallback
     return {
@@ -104,6 +106,7 @@ def get_fico_section_c_metrics(filters: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_fico_section_d_metrics(filters: Dict[str, Any]) -> Dict[str, Any]:
     """
     Get Section D (Student Participation / Talk Time) metrics.
@@ -111,24 +114,9 @@ def get_fico_section_d_metrics(filters: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict with student_talk_time, teacher_talk_time, target_student_time
     """
-    region = filters.get("region", "Combined")
-    obs_type = filters.get("observation_type", "All Observations")
-
-    if region == "Balochistan":
-        return balochistan_queries.get_talk_time_metrics(obs_type)
-
-    elif region == "Moawin":
-        return moawin_queries.get_talk_time_metrics(obs_type)
-
-    elif region == "Islamabad":
-        return islamabad_queries.get_talk_time_metrics(obs_type)
-
-    elif region == "Rawalpindi":
-        return rawalpindi_queries.get_talk_time_metrics(obs_type)
-
-    elif region == "Combined":
-        # Only Balochistan has talk time data
-        return balochistan_queries.get_talk_time_metrics(obs_type)
+    source = _FICO_DETAIL_SOURCES.get(filters.get("region", "Combined"))
+    if source is not None:
+        return source.get_talk_time_metrics(filters.get("observation_type", "All Observations"))
 
     # Default fallback
     return {
@@ -139,6 +127,7 @@ def get_fico_section_d_metrics(filters: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_fico_scores(filters: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     """
     Get all FICO section scores (B, C, D).
@@ -173,6 +162,7 @@ def get_fico_scores(filters: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
 # OBSERVATION QUERIES ROUTER
 # ============================================================================
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_observation_counts(filters: Dict[str, Any]) -> Dict[str, Any]:
     """
     Get AI vs Human observation counts.
@@ -209,6 +199,7 @@ def get_observation_counts(filters: Dict[str, Any]) -> Dict[str, Any]:
     return {"ai_count": 0, "human_count": 0, "total": 0}
 
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_observation_trend(filters: Dict[str, Any], weeks: int = 8) -> List[Dict[str, Any]]:
     """
     Get weekly observation counts for trend chart.
@@ -243,6 +234,7 @@ def get_observation_trend(filters: Dict[str, Any], weeks: int = 8) -> List[Dict[
 # SCHOOL & TEACHER QUERIES ROUTER
 # ============================================================================
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_school_count(filters: Dict[str, Any]) -> int:
     """Get count of schools based on filters."""
     region = filters.get("region", "Combined")
@@ -268,6 +260,7 @@ def get_school_count(filters: Dict[str, Any]) -> int:
     return 0
 
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_teacher_count(filters: Dict[str, Any]) -> int:
     """Get count of teachers based on filters."""
     region = filters.get("region", "Combined")
@@ -292,6 +285,7 @@ def get_teacher_count(filters: Dict[str, Any]) -> int:
     return 0
 
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_student_count(filters: Dict[str, Any]) -> int:
     """Get count of students based on filters."""
     region = filters.get("region", "Combined")
@@ -321,6 +315,7 @@ def get_student_count(filters: Dict[str, Any]) -> int:
 # COACHING SESSION QUERIES
 # ============================================================================
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_recent_sessions(filters: Dict[str, Any], limit: int = 10) -> List[Dict[str, Any]]:
     """
     Get recent coaching/observation sessions.
@@ -354,6 +349,7 @@ def get_recent_sessions(filters: Dict[str, Any], limit: int = 10) -> List[Dict[s
 # STUDENT SCORES QUERIES
 # ============================================================================
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_student_scores_by_subject(filters: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Get average student scores by subject.
@@ -377,6 +373,7 @@ def get_student_scores_by_subject(filters: Dict[str, Any]) -> List[Dict[str, Any
 # ATTENDANCE QUERIES
 # ============================================================================
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def get_attendance_trend(filters: Dict[str, Any], days: int = 30) -> List[Dict[str, Any]]:
     """
     Get daily attendance rates.
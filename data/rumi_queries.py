@@ -10,6 +10,7 @@ Verified counts (Feb 2026):
 - 1,815 lesson plans generated
 - 197 reading assessments
 """
+from types import MappingProxyType
 from typing import Dict, Any, List
 from .db_connections import query_rumi, get_rumi_connection
 
@@ -25,6 +26,15 @@ RUMI_KNOWN_VALUES = {
 }
 
 
+# SQL predicate per sidebar time period; unknown periods apply no filter
+_TIME_FILTER_SQL = MappingProxyType({
+    "Last 7 Days": "AND created_at > NOW() - INTERVAL '7 days'",
+    "Last 30 Days": "AND created_at > NOW() - INTERVAL '30 days'",
+    "Last 90 Days": "AND created_at > NOW() - INTERVAL '90 days'",
+    "This Year": "AND EXTRACT(YEAR FROM created_at) = EXTRACT(YEAR FROM NOW())",
+})
+
+
 def get_summary_metrics(time_period: str = "All Time") -> Dict[str, Any]:
     """
     Get summary metrics for Rumi.
@@ -35,16 +45,7 @@ def get_summary_metrics(time_period: str = "All Time") -> Dict[str, Any]:
     Returns:
         Dict with schools, teachers, ai_sessions, human_observations, avg_score, students
     """
-    # Build time filter
-    time_filter = ""
-    if time_period == "Last 7 Days":
-        time_filter = "AND created_at > NOW() - INTERVAL '7 days'"
-    elif time_period == "Last 30 Days":
-        time_filter = "AND created_at > NOW() - INTERVAL '30 days'"
-    elif time_period == "Last 90 Days":
-        time_filter = "AND created_at > NOW() - INTERVAL '90 days'"
-    elif time_period == "This Year":
-        time_filter = "AND EXTRACT(YEAR FROM created_at) = EXTRACT(YEAR FROM NOW())"
+    time_filter = _TIME_FILTER_SQL.get(time_period, "")
 
     # Get user count
     user_sql = f"""
@@ -341,6 +341,29 @@ html, body, [class*="css"] {
     border-bottom: none;
 }
 
+/* === DATA FRESHNESS BANNER === */
+.freshness-banner {
+    display: grid;
+    grid-template-columns: auto 1fr auto;
+    gap: 0.5rem;
+    align-items: center;
+    background: #F0FDF4;
+    border: 1px solid #BBF7D0;
+    border-radius: 8px;
+    padding: 0.5rem 1rem;
+    margin-bottom: 1rem;
+    font-size: 0.75rem;
+    color: #166534;
+}
+.freshness-banner-dot {
+    color: #16A34A;
+    font-size: 0.625rem;
+}
+.freshness-banner-sources {
+    font-size: 0.6875rem;
+    color: #6B7280;
+}
+
 /* === OBSERVATION CARD === */
 .obs-card {
     background: white;
@@ -443,10 +466,15 @@ section[data-testid="stSidebar"] .stRadio > div > label {
 """
 
 
+# Built once at import. The tag is still emitted on every rerun: Streamlit
+# drops any element a rerun does not re-emit, styles included.
+_CSS_TAG = f'<style>{CSS}</style>'
+
+
 def inject_css():
     """Inject the design system CSS into a Streamlit app."""
     import streamlit as st
-    st.markdown(f'<style>{CSS}</style>', unsafe_allow_html=True)
+    st.markdown(_CSS_TAG, unsafe_allow_html=True)
 
 
 def get_color(name: str) -> str:
@@ -497,6 +525,31 @@ def plotly_layout_defaults(height: int = 280) -> dict:
     }
 
 
+PLOTLY_TEMPLATE = 'taleemabad'
+
+
+def register_plotly_template() -> str:
+    """
+    Register the design system layout as a Plotly template and make it default.
+
+    Layered on top of Plotly's own template, so figures only need to set the
+    keys that differ per chart (height, legend, axis ranges). Safe to call on
+    every rerun; registration happens once per process.
+
+    Returns:
+        Name of the registered template
+    """
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    if PLOTLY_TEMPLATE not in pio.templates:
+        layout = plotly_layout_defaults()
+        del layout['height']
+        pio.templates[PLOTLY_TEMPLATE] = go.layout.Template(layout=layout)
+        pio.templates.default = f'plotly+{PLOTLY_TEMPLATE}'
+    return PLOTLY_TEMPLATE
+
+
 def plotly_bar_defaults() -> dict:
     """Return standard Plotly bar chart defaults."""
     return {
@@ -521,14 +574,38 @@ def hero_metric(value: str, label: str, context: str = "", color: str = None) ->
     )
 
 
+_METRIC_CARD_TPL = (
+    '<div class="metric-card">'
+    '<div class="metric-card-value"{color_style}>{value}</div>'
+    '<div class="metric-card-label">{label}</div>'
+    '</div>'
+)
+
+
 def metric_card(value: str, label: str, color: str = None) -> str:
     """Generate HTML for a metric card."""
-    color_style = f'style="color: {color};"' if color else ''
+    return _METRIC_CARD_TPL.format(
+        color_style=f' style="color: {color};"' if color else '',
+        value=value,
+        label=label,
+    )
+
+
+def metric_row(cards: list, columns: int = 4) -> str:
+    """
+    Generate HTML for a row of metric cards laid out on a CSS grid.
+
+    Args:
+        cards: List of (value, label, color) tuples; color may be None
+        columns: Number of grid columns
+
+    Returns:
+        HTML string for a single st.markdown call
+    """
     return (
-        f'<div class="metric-card">'
-        f'<div class="metric-card-value" {color_style}>{value}</div>'
-        f'<div class="metric-card-label">{label}</div>'
-        f'</div>'
+        f'<div style="display: grid; grid-template-columns: repeat({columns}, 1fr); gap: 0.75rem;">'
+        + ''.join(metric_card(value, label, color) for value, label, color in cards)
+        + '</div>'
     )
 
 
@@ -606,6 +683,39 @@ def grade_row(label: str, value: float, color: str) -> str:
     )
 
 
+def grade_rows(items: list) -> str:
+    """
+    Generate HTML for a block of grade progress rows.
+
+    Args:
+        items: List of (label, value, color) tuples
+
+    Returns:
+        HTML string for a single st.markdown call
+    """
+    return '<div>' + ''.join(grade_row(label, value, color) for label, value, color in items) + '</div>'
+
+
+def no_data_html(region_label: str, reason: str = "No data available") -> str:
+    """Generate HTML for a region with no data."""
+    return (
+        f'<div style="background: #F9FAFB; border-radius: 8px; padding: 1rem; '
+        f'text-align: center; border: 1px dashed #E5E7EB;">'
+        f'<div style="font-size: 0.8125rem; font-weight: 600; color: #9CA3AF;">'
+        f'{region_label}</div>'
+        f'<div style="font-size: 0.75rem; color: #D1D5DB; margin-top: 0.25rem;">'
+        f'{reason}</div>'
+        f'</div>'
+    )
+
+
+# Fixed "no data" placeholders, built once at import
+NO_DATA_HTML = {
+    "moawin_scores": no_data_html("Moawin", "No student assessment data available"),
+    "rwp_learning": no_data_html("Rawalpindi", "No data yet — launching Q2 2026"),
+}
+
+
 def rec_card(title: str, description: str, color: str = None) -> str:
     """Generate HTML for a recommendation card."""
     border_style = f' border-left: 3px solid {color};' if color else ''